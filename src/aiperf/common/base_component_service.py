@@ -72,7 +72,7 @@ class BaseComponentService(BaseService):
         )
         result = None
         command_message = RegisterServiceCommand(
-            command_id=str(uuid.uuid4()),
+            command_id=uuid.uuid4().hex,
             service_id=self.service_id,
             service_type=self.service_type,
             # Target the system controller directly to avoid broadcasting to all services.
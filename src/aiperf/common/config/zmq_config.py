@@ -183,7 +183,13 @@ class ZMQIPCProxyConfig(BaseZMQProxyConfig):
 
 
 class ZMQTCPConfig(BaseZMQCommunicationConfig):
-    """Configuration for TCP transport."""
+    """Configuration for TCP transport.
+
+    Only needed when services or subscribers run on different hosts. When everything
+    runs on the same host, prefer :class:`ZMQIPCConfig` (the default), which avoids the
+    loopback network stack. Note that libzmq always enables TCP_NODELAY on its TCP
+    connections, so no additional socket tuning is required here.
+    """
 
     _CLI_GROUP = Groups.ZMQ_COMMUNICATION
     comm_backend: ClassVar[CommunicationBackend] = CommunicationBackend.ZMQ_TCP
@@ -274,8 +280,7 @@ class ZMQIPCConfig(BaseZMQCommunicationConfig):
         """Validate provided path or create a temporary path for IPC sockets."""
         if self.path is None:
             self.path = Path(tempfile.mkdtemp()) / "aiperf"
-        if not self.path.exists():
-            self.path.mkdir(parents=True, exist_ok=True)
+        self.path.mkdir(parents=True, exist_ok=True)
         for proxy_config in [
             self.dataset_manager_proxy_config,
             self.event_bus_proxy_config,
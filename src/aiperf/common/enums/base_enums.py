@@ -20,6 +20,9 @@ class CaseInsensitiveStrEnum(str, Enum):
         return f"{self.__class__.__name__}.{self.name}"
 
     def __eq__(self, other: object) -> bool:
+        # Fast path for member-to-member comparisons, which are the common case on hot paths.
+        if self is other:
+            return True
         if isinstance(other, str):
             return self.value.lower() == other.lower()
         if isinstance(other, Enum):
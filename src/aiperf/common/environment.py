@@ -570,18 +570,39 @@ class _ZMQSettings(BaseSettings):
         default=0.1,
         description="Delay in seconds between retry attempts for ZMQ PUSH operations",
     )
+    RCVHWM: int = Field(
+        ge=0,
+        le=100000000,
+        default=0,
+        description="Socket receive high water mark in messages (0 = unlimited). "
+        "Bounds memory when subscribers fall behind, at the cost of dropping messages on PUB/SUB sockets",
+    )
     RCVTIMEO: int = Field(
         ge=1,
         le=10000000,
         default=300000,  # 5 minutes
         description="Socket receive timeout in milliseconds (default: 5 minutes)",
     )
+    SNDHWM: int = Field(
+        ge=0,
+        le=100000000,
+        default=0,
+        description="Socket send high water mark in messages (0 = unlimited). "
+        "Bounds memory when receivers fall behind, at the cost of dropping messages on PUB/SUB sockets",
+    )
     SNDTIMEO: int = Field(
         ge=1,
         le=10000000,
         default=300000,  # 5 minutes
         description="Socket send timeout in milliseconds (default: 5 minutes)",
     )
+    SUB_DRAIN_BATCH_SIZE: int = Field(
+        ge=1,
+        le=100000,
+        default=64,
+        description="Maximum number of queued messages a ZMQ SUB client drains without blocking "
+        "after each wakeup, before yielding back to the event loop",
+    )
     TCP_KEEPALIVE_IDLE: int = Field(
         ge=1,
         le=100000,
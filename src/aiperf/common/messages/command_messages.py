@@ -67,7 +67,7 @@ class CommandMessage(TargetedServiceMessage):
         description="Command to execute",
     )
     command_id: str = Field(
-        default_factory=lambda: str(uuid.uuid4()),
+        default_factory=lambda: uuid.uuid4().hex,
         description="Unique identifier for this command. If not provided, a random UUID will be generated.",
     )
 
@@ -25,6 +25,18 @@ from aiperf.common.mixins.task_manager_mixin import TaskManagerMixin
 from aiperf.common.models import ErrorDetails, ExitErrorInfo
 from aiperf.common.protocols import AIPerfLifecycleProtocol
 
+# States in which a repeated initialize() or start() request is a no-op, shared as
+# module-level constants.
+_ALREADY_INITIALIZED_STATES = frozenset(
+    {
+        LifecycleState.INITIALIZING,
+        LifecycleState.INITIALIZED,
+        LifecycleState.STARTING,
+        LifecycleState.RUNNING,
+    }
+)
+_ALREADY_STARTED_STATES = frozenset({LifecycleState.STARTING, LifecycleState.RUNNING})
+
 
 @provides_hooks(
     AIPerfHook.ON_INIT,
@@ -138,12 +150,7 @@ class AIPerfLifecycleMixin(TaskManagerMixin, HooksMixin):
         NOTE: It is generally discouraged from overriding this method.
         Instead, use the @on_init hook to handle your own initialization logic.
         """
-        if self.state in (
-            LifecycleState.INITIALIZING,
-            LifecycleState.INITIALIZED,
-            LifecycleState.STARTING,
-            LifecycleState.RUNNING,
-        ):
+        if self.state in _ALREADY_INITIALIZED_STATES:
             self.debug(
                 lambda: f"Ignoring initialize request for {self} in state {self.state}"
             )
@@ -167,10 +174,7 @@ class AIPerfLifecycleMixin(TaskManagerMixin, HooksMixin):
         NOTE: It is generally discouraged from overriding this method.
         Instead, use the @on_start hook to handle your own starting logic.
         """
-        if self.state in (
-            LifecycleState.STARTING,
-            LifecycleState.RUNNING,
-        ):
+        if self.state in _ALREADY_STARTED_STATES:
             self.debug(
                 lambda: f"Ignoring start request for {self} in state {self.state}"
             )
@@ -24,15 +24,20 @@ class WorkerTrackerMixin(MessageBusClientMixin):
         """Update the worker stats from a worker health message."""
         worker_id = message.service_id
         async with self._workers_stats_lock:
-            if worker_id not in self._workers_stats:
-                self._workers_stats[worker_id] = WorkerStats(worker_id=worker_id)
-            self._workers_stats[worker_id].health = message.health
-            self._workers_stats[worker_id].task_stats = message.task_stats
-            await self.run_hooks(
-                AIPerfHook.ON_WORKER_UPDATE,
-                worker_id=worker_id,
-                worker_stats=self._workers_stats[worker_id],
-            )
+            worker_stats = self._workers_stats.get(worker_id)
+            if worker_stats is None:
+                worker_stats = self._workers_stats[worker_id] = WorkerStats(
+                    worker_id=worker_id
+                )
+            worker_stats.health = message.health
+            worker_stats.task_stats = message.task_stats
+        # NOTE: Run the hooks outside of the lock so that slow hooks (e.g. UI updates) do not
+        #       block other worker updates from being recorded.
+        await self.run_hooks(
+            AIPerfHook.ON_WORKER_UPDATE,
+            worker_id=worker_id,
+            worker_stats=worker_stats,
+        )
 
     @on_message(MessageType.WORKER_STATUS_SUMMARY)
     async def _on_worker_status_summary(self, message: WorkerStatusSummaryMessage):
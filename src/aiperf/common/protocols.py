@@ -440,6 +440,8 @@ class ServiceManagerProtocol(AIPerfLifecycleProtocol, Protocol):
     service_map: dict[ServiceTypeT, list[ServiceRunInfo]]
     service_id_map: dict[str, ServiceRunInfo]
 
+    def register_service(self, service_info: ServiceRunInfo) -> None: ...
+
     async def run_service(
         self, service_type: ServiceTypeT, num_replicas: int = 1
     ) -> None: ...
@@ -41,6 +41,9 @@ class BaseServiceManager(AIPerfLifecycleMixin, ABC):
         # Create service ID map for component lookups
         self.service_id_map: dict[str, ServiceRunInfo] = {}
 
+        # Set whenever a service registers, so waiters can wake up immediately
+        self._service_registered_event = asyncio.Event()
+
     @on_start
     async def _start_service_manager(self) -> None:
         await self.run_required_services()
@@ -65,6 +68,12 @@ class BaseServiceManager(AIPerfLifecycleMixin, ABC):
         self, service_type: ServiceTypeT, service_id: str | None = None
     ) -> list[BaseException | None]: ...
 
+    def register_service(self, service_info: ServiceRunInfo) -> None:
+        """Record a registered service and wake up anyone waiting on registrations."""
+        self.service_id_map[service_info.service_id] = service_info
+        self.service_map.setdefault(service_info.service_type, []).append(service_info)
+        self._service_registered_event.set()
+
     # TODO: This stuff needs some major cleanup
 
     async def stop_services_by_type(
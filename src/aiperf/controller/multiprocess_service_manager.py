@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 import asyncio
+import contextlib
 import multiprocessing
 import uuid
 from multiprocessing import Process
@@ -151,10 +152,12 @@ class MultiProcessServiceManager(BaseServiceManager):
         # Get the set of required service types for checking completion
         required_types = set(self.required_services.keys())
 
-        # TODO: Can this be done better by using asyncio.Event()?
-
         async def _wait_for_registration():
             while not stop_event.is_set():
+                # Clear before checking, so a registration that lands after the check
+                # still wakes up the wait below.
+                self._service_registered_event.clear()
+
                 # Get all registered service types from the id map
                 registered_types = {
                     service_info.service_type
@@ -173,8 +176,12 @@ class MultiProcessServiceManager(BaseServiceManager):
                             f"Service process {process.service_id} died before registering"
                         )
 
-                # Wait a bit before checking again
-                await asyncio.sleep(0.5)
+                # Wake up as soon as another service registers, or re-check process
+                # liveness and the stop event periodically.
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(
+                        self._service_registered_event.wait(), timeout=0.5
+                    )
 
         try:
             await asyncio.wait_for(_wait_for_registration(), timeout=timeout_seconds)
@@ -200,19 +207,55 @@ class MultiProcessServiceManager(BaseServiceManager):
         if not info.process or not info.process.is_alive():
             return
 
-        try:
-            info.process.terminate()
-            await asyncio.to_thread(
-                info.process.join, timeout=Environment.SERVICE.TASK_CANCEL_TIMEOUT_SHORT
-            )
+        info.process.terminate()
+        if await self._wait_for_process_exit(
+            info.process, timeout=Environment.SERVICE.TASK_CANCEL_TIMEOUT_SHORT
+        ):
             self.debug(
                 f"Service {info.service_type} process stopped (pid: {info.process.pid})"
             )
+            return
+
+        self.warning(
+            f"Service {info.service_type} process (pid: {info.process.pid}) did not terminate gracefully, killing"
+        )
+        info.process.kill()
+        await self._wait_for_process_exit(
+            info.process, timeout=Environment.SERVICE.TASK_CANCEL_TIMEOUT_SHORT
+        )
+
+    @staticmethod
+    async def _wait_for_process_exit(
+        process: Process | SpawnProcess | ForkProcess, timeout: float
+    ) -> bool:
+        """Wait up to timeout seconds for a process to exit, returning whether it did.
+
+        The process sentinel becomes readable when the process exits, so it is watched
+        by the event loop directly instead of parking a thread in a blocking join().
+        """
+        loop = asyncio.get_running_loop()
+        exited = loop.create_future()
+
+        def _on_exit() -> None:
+            if not exited.done():
+                exited.set_result(None)
+
+        try:
+            loop.add_reader(process.sentinel, _on_exit)
+        except NotImplementedError:
+            # Event loops without add_reader (e.g. the Windows proactor loop)
+            await asyncio.to_thread(process.join, timeout)
+            return not process.is_alive()
+
+        try:
+            await asyncio.wait_for(exited, timeout=timeout)
         except asyncio.TimeoutError:
-            self.warning(
-                f"Service {info.service_type} process (pid: {info.process.pid}) did not terminate gracefully, killing"
-            )
-            info.process.kill()
+            return False
+        finally:
+            loop.remove_reader(process.sentinel)
+
+        process.join()  # already exited, so this only reaps it
+        return True
 
     async def wait_for_all_services_start(
         self,
@@ -278,10 +278,7 @@ class SystemController(SignalHandlerMixin, BaseService):
             last_seen=time.time_ns(),
         )
 
-        self.service_manager.service_id_map[message.service_id] = service_info
-        if message.service_type not in self.service_manager.service_map:
-            self.service_manager.service_map[message.service_type] = []
-        self.service_manager.service_map[message.service_type].append(service_info)
+        self.service_manager.register_service(service_info)
 
         try:
             type_name = ServiceType(message.service_type).name.title().replace("_", " ")
@@ -308,7 +305,7 @@ class SystemController(SignalHandlerMixin, BaseService):
             service_info = self.service_manager.service_id_map[service_id]
             service_info.last_seen = timestamp
             service_info.state = message.state
-            self.debug(f"Updated heartbeat for {service_id} to {timestamp}")
+            self.debug(lambda: f"Updated heartbeat for {service_id} to {timestamp}")
         except Exception:
             self.warning(
                 f"Received heartbeat from unknown service: {service_id} ({service_type})"
@@ -358,7 +355,7 @@ class SystemController(SignalHandlerMixin, BaseService):
 
         service_info.state = message.state
 
-        self.debug(f"Updated state for {service_id} to {message.state}")
+        self.debug(lambda: f"Updated state for {service_id} to {message.state}")
 
     @on_message(MessageType.TELEMETRY_STATUS)
     async def _on_telemetry_status_message(
@@ -386,13 +383,17 @@ class SystemController(SignalHandlerMixin, BaseService):
         """Process a command response message."""
         self.debug(lambda: f"Received command response message: {message}")
         if message.status == CommandResponseStatus.SUCCESS:
-            self.debug(f"Command {message.command} succeeded from {message.service_id}")
+            self.debug(
+                lambda: f"Command {message.command} succeeded from {message.service_id}"
+            )
         elif message.status == CommandResponseStatus.ACKNOWLEDGED:
             self.debug(
-                f"Command {message.command} acknowledged from {message.service_id}"
+                lambda: f"Command {message.command} acknowledged from {message.service_id}"
             )
         elif message.status == CommandResponseStatus.UNHANDLED:
-            self.debug(f"Command {message.command} unhandled from {message.service_id}")
+            self.debug(
+                lambda: f"Command {message.command} unhandled from {message.service_id}"
+            )
         elif message.status == CommandResponseStatus.FAILURE:
             message = cast(CommandErrorResponse, message)
             self.error(
@@ -100,9 +100,9 @@ class EmbeddingsEndpoint(BaseEndpoint):
             for item in data
         ):
             embeddings = [
-                item.get("embedding")
+                embedding
                 for item in data
-                if item.get("embedding") is not None
+                if (embedding := item.get("embedding")) is not None
             ]
             if not embeddings:
                 return None
@@ -146,6 +146,8 @@ class MetricArray(Generic[MetricValueTypeVarT]):
     This is used to store the values of a metric over time.
     """
 
+    __slots__ = ("_capacity", "_data", "_size", "_sum")
+
     def __init__(
         self, initial_capacity: int = Environment.METRICS.ARRAY_INITIAL_CAPACITY
     ):
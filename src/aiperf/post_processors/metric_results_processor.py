@@ -72,8 +72,8 @@ class MetricResultsProcessor(BaseMetricsProcessor):
 
         # Get the appropriate results dict and instances map once to avoid multiple calls
         request_start_ns = record_data.metadata.request_start_ns
-        instances_map = await self.get_instances_map(request_start_ns)
-        results_dict = await self.get_results(request_start_ns)
+        instances_map = self.get_instances_map(request_start_ns)
+        results_dict = self.get_results(request_start_ns)
 
         for tag, value in record_data.metrics.items():
             try:
@@ -96,14 +96,16 @@ class MetricResultsProcessor(BaseMetricsProcessor):
                 else:
                     raise ValueError(f"Metric '{tag}' is not a valid metric type")
             except NoMetricValue as e:
-                self.debug(f"No metric value for metric '{tag}': {e!r}")
+                self.debug(
+                    lambda tag=tag, e=e: f"No metric value for metric '{tag}': {e!r}"
+                )
             except Exception as e:
                 self.warning(f"Error processing metric '{tag}': {e!r}")
 
         if self.is_trace_enabled:
             self.trace(f"Results after processing incoming metrics: {results_dict}")
 
-    async def get_instances_map(
+    def get_instances_map(
         self, request_start_ns: int | None = None
     ) -> dict[MetricTagT, BaseMetric]:
         """Get the appropriate instances map based on mode.
@@ -113,9 +115,7 @@ class MetricResultsProcessor(BaseMetricsProcessor):
         """
         return self._instances_map
 
-    async def get_results(
-        self, request_start_ns: int | None = None
-    ) -> MetricResultsDict:
+    def get_results(self, request_start_ns: int | None = None) -> MetricResultsDict:
         """Get the appropriate results dictionary based on mode.
 
         In non-timeslice mode, returns the single shared results dict.
@@ -53,10 +53,10 @@ class TimesliceMetricResultsProcessor(MetricResultsProcessor):
             MetricResultsDict
         )
 
-    async def get_timeslice_index(self, request_start_ns: int):
+    def get_timeslice_index(self, request_start_ns: int):
         return int(request_start_ns / self._slice_duration_ns)
 
-    async def get_instances_map(
+    def get_instances_map(
         self, request_start_ns: int | None = None
     ) -> dict[MetricTagT, BaseMetric]:
         """Get the appropriate instances map based on mode."""
@@ -66,21 +66,19 @@ class TimesliceMetricResultsProcessor(MetricResultsProcessor):
                 "TimesliceMetricResultsProcessor::get_instances_map must be passed a request_start_ns"
             )
 
-        timeslice_index = await self.get_timeslice_index(request_start_ns)
+        timeslice_index = self.get_timeslice_index(request_start_ns)
 
         # Return (or create) the timeslice instances dict for this timeslice
         return self._timeslice_instances_maps[timeslice_index]
 
-    async def get_results(
-        self, request_start_ns: int | None = None
-    ) -> MetricResultsDict:
+    def get_results(self, request_start_ns: int | None = None) -> MetricResultsDict:
         """Get the results dict for the appropriate timeslice based on request timestamp."""
         if request_start_ns is None:
             raise ValueError(
                 "TimesliceMetricResultsProcessor::get_results must be passed a request_start_ns"
             )
 
-        timeslice_index = await self.get_timeslice_index(request_start_ns)
+        timeslice_index = self.get_timeslice_index(request_start_ns)
 
         # Return (or create) the timeslice results dict for this timeslice
         return self._timeslice_results[timeslice_index]
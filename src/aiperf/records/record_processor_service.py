@@ -174,15 +174,7 @@ class RecordProcessor(PullClientMixin, BaseComponentService):
         metadata = self._create_metric_record_metadata(
             message.record, message.service_id
         )
-        raw_results = await self._process_record(parsed_record, metadata)
-        results = []
-        for result in raw_results:
-            if isinstance(result, BaseException):
-                self.error(
-                    f"Error processing record: {result!r}: {traceback.format_exception(result)}"
-                )
-            else:
-                results.append(result)
+        results = await self._process_record(parsed_record, metadata)
 
         await self.records_push_client.push(
             MetricRecordsMessage(
@@ -195,16 +187,27 @@ class RecordProcessor(PullClientMixin, BaseComponentService):
 
     async def _process_record(
         self, record: ParsedResponseRecord, metadata: MetricRecordMetadata
-    ) -> list[MetricRecordDict | BaseException]:
-        """Stream a record to the records processors."""
+    ) -> list[MetricRecordDict]:
+        """Stream a record to the records processors.
+
+        Errors are logged and dropped along with empty results in a single pass.
+        """
         tasks = [
             processor.process_record(record, metadata)
             for processor in self.records_processors
         ]
-        results: list[MetricRecordDict | BaseException | None] = await asyncio.gather(
-            *tasks, return_exceptions=True
-        )
-        return [result for result in results if result is not None]
+        raw_results: list[
+            MetricRecordDict | BaseException | None
+        ] = await asyncio.gather(*tasks, return_exceptions=True)
+        results: list[MetricRecordDict] = []
+        for result in raw_results:
+            if isinstance(result, BaseException):
+                self.error(
+                    f"Error processing record: {result!r}: {traceback.format_exception(result)}"
+                )
+            elif result is not None:
+                results.append(result)
+        return results
 
 
 def main() -> None:
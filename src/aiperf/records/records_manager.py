@@ -74,10 +74,10 @@ class TelemetryTrackingState:
     statistics for GPU telemetry collection and processing.
     """
 
+    # Unlocked for the same reason as RecordsManager.error_summary
     error_counts: dict[ErrorDetails, int] = field(
         default_factory=lambda: defaultdict(int)
     )
-    error_counts_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
 
     task_runs: int = 0
     total_gen_time_ms: float = 0.0
@@ -125,8 +125,9 @@ class RecordsManager(PullClientMixin, BaseComponentService):
 
         self._completion_checker = PhaseCompletionChecker()
 
+        # NOTE: No lock is needed. Every update is a single synchronous increment, so
+        #       other tasks cannot observe or interleave with a partial update.
         self.error_summary: dict[ErrorDetails, int] = {}
-        self.error_summary_lock: asyncio.Lock = asyncio.Lock()
         # Track per-worker statistics
         self.worker_stats: dict[str, ProcessingStats] = {}
         self.worker_stats_lock: asyncio.Lock = asyncio.Lock()
@@ -201,7 +202,7 @@ class RecordsManager(PullClientMixin, BaseComponentService):
         elif record_data.valid and not should_include_request:
             # Timed out record
             self.debug(
-                f"Filtered out record from worker {worker_id} - response received after duration"
+                lambda: f"Filtered out record from worker {worker_id} - response received after duration"
             )
         else:
             # Invalid record
@@ -213,10 +214,9 @@ class RecordsManager(PullClientMixin, BaseComponentService):
             async with self.processing_status_lock:
                 self.processing_stats.errors += 1
             if record_data.error:
-                async with self.error_summary_lock:
-                    self.error_summary[record_data.error] = (
-                        self.error_summary.get(record_data.error, 0) + 1
-                    )
+                self.error_summary[record_data.error] = (
+                    self.error_summary.get(record_data.error, 0) + 1
+                )
 
         await self._check_if_all_records_received()
 
@@ -230,19 +230,10 @@ class RecordsManager(PullClientMixin, BaseComponentService):
             message: Batch of telemetry records from a DCGM collector
         """
         if message.valid:
-            try:
-                await self._send_telemetry_to_results_processors(message.records)
-            except Exception as e:
-                error_details = ErrorDetails(
-                    message=f"Telemetry processor error: {str(e)}"
-                )
-                async with self._telemetry_state.error_counts_lock:
-                    self._telemetry_state.error_counts[error_details] += 1
-                self.debug(f"Failed to process telemetry batch: {e}")
+            await self._send_telemetry_to_results_processors(message.records)
         else:
             if message.error:
-                async with self._telemetry_state.error_counts_lock:
-                    self._telemetry_state.error_counts[message.error] += 1
+                self._telemetry_state.error_counts[message.error] += 1
 
     def _should_include_request_by_duration(
         self, record_data: MetricRecordsData
@@ -267,7 +258,7 @@ class RecordsManager(PullClientMixin, BaseComponentService):
         # If so, filter out the entire request (all-or-nothing approach)
         if record_data.metadata.request_end_ns > duration_end_ns:
             self.debug(
-                f"Filtering out timed-out request - response received "
+                lambda: f"Filtering out timed-out request - response received "
                 f"{record_data.metadata.request_end_ns - duration_end_ns} ns after timeout"
             )
             return False
@@ -340,14 +331,29 @@ class RecordsManager(PullClientMixin, BaseComponentService):
     ) -> None:
         """Send individual telemetry records to telemetry results processors only.
 
+        Each processor consumes the whole batch in a single task, rather than
+        scheduling one task per record per processor. A record that fails is counted
+        as a telemetry error and does not stop the rest of the batch.
+
         Args:
             telemetry_records: Batch of records from single collection cycle
         """
+
+        async def _process_batch(processor: TelemetryResultsProcessorProtocol) -> None:
+            for record in telemetry_records:
+                try:
+                    await processor.process_telemetry_record(record)
+                except Exception as e:
+                    error_details = ErrorDetails(
+                        message=f"Telemetry processor error: {str(e)}"
+                    )
+                    self._telemetry_state.error_counts[error_details] += 1
+                    self.debug(lambda e=e: f"Failed to process telemetry record: {e!r}")
+
         await asyncio.gather(
             *[
-                processor.process_telemetry_record(record)
+                _process_batch(processor)
                 for processor in self._telemetry_results_processors
-                for record in telemetry_records  # Process each record individually
             ]
         )
 
@@ -693,8 +699,7 @@ class RecordsManager(PullClientMixin, BaseComponentService):
                 end_ns=self.end_time_ns or time.time_ns(),
             )
 
-        async with self._telemetry_state.error_counts_lock:
-            unique_errors = list(self._telemetry_state.error_counts.keys())
+        unique_errors = list(self._telemetry_state.error_counts.keys())
 
         return ProcessTelemetryResult(
             results=telemetry_results,
@@ -718,19 +723,17 @@ class RecordsManager(PullClientMixin, BaseComponentService):
 
     async def get_error_summary(self) -> list[ErrorDetailsCount]:
         """Generate a summary of the error records."""
-        async with self.error_summary_lock:
-            return [
-                ErrorDetailsCount(error_details=error_details, count=count)
-                for error_details, count in self.error_summary.items()
-            ]
+        return [
+            ErrorDetailsCount(error_details=error_details, count=count)
+            for error_details, count in self.error_summary.items()
+        ]
 
     async def get_telemetry_error_summary(self) -> list[ErrorDetailsCount]:
         """Generate a summary of the telemetry error records."""
-        async with self._telemetry_state.error_counts_lock:
-            return [
-                ErrorDetailsCount(error_details=error_details, count=count)
-                for error_details, count in self._telemetry_state.error_counts.items()
-            ]
+        return [
+            ErrorDetailsCount(error_details=error_details, count=count)
+            for error_details, count in self._telemetry_state.error_counts.items()
+        ]
 
 
 def main() -> None:
@@ -11,7 +11,7 @@ import orjson
 
 from aiperf.common.enums import TransportType
 from aiperf.common.exceptions import NotInitializedError
-from aiperf.common.factories import TransportFactory
+from aiperf.common.factories import EndpointFactory, TransportFactory
 from aiperf.common.hooks import on_init, on_stop
 from aiperf.common.models import ErrorDetails, RequestInfo, RequestRecord
 from aiperf.transports.aiohttp_client import AioHttpClient
@@ -104,8 +104,6 @@ class AioHttpTransport(BaseTransport):
             url = f"{base_url}/{path}"
         else:
             # Get endpoint path from endpoint metadata
-            from aiperf.common.factories import EndpointFactory
-
             endpoint_metadata = EndpointFactory.get_metadata(endpoint_info.type)
             endpoint_path = endpoint_metadata.endpoint_path
             if (
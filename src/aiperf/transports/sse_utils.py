@@ -145,7 +145,7 @@ class AsyncSSEStreamReader:
                 raw_message = message_bytes.decode("utf-8", errors="replace").strip()
                 if not raw_message:
                     _logger.debug(
-                        f"Skipping empty SSE message at chunk {chunk_perf_ns}"
+                        lambda chunk_perf_ns=chunk_perf_ns: f"Skipping empty SSE message at chunk {chunk_perf_ns}"
                     )
                     continue
 
@@ -110,7 +110,7 @@ class ZMQDealerRequestClient(BaseZMQClient, TaskManagerMixin):
 
         # Generate request ID if not provided so that responses can be matched
         if not message.request_id:
-            message.request_id = str(uuid.uuid4())
+            message.request_id = uuid.uuid4().hex
 
         self.request_callbacks[message.request_id] = callback
 
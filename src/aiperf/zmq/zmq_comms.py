@@ -128,14 +128,9 @@ class ZMQIPCCommunication(BaseZMQCommunication):
     def _setup_ipc_directory(self) -> None:
         """Create IPC socket directory if using IPC transport."""
         self._ipc_socket_dir = Path(self.config.path)
-        if not self._ipc_socket_dir.exists():
-            self.debug(
-                f"IPC socket directory does not exist, creating: {self._ipc_socket_dir}"
-            )
-            self._ipc_socket_dir.mkdir(parents=True, exist_ok=True)
-            self.debug(f"Created IPC socket directory: {self._ipc_socket_dir}")
-        else:
-            self.debug(f"IPC socket directory already exists: {self._ipc_socket_dir}")
+        # exist_ok makes a separate exists() stat redundant
+        self._ipc_socket_dir.mkdir(parents=True, exist_ok=True)
+        self.debug(f"Using IPC socket directory: {self._ipc_socket_dir}")
 
     @on_stop
     def _cleanup_ipc_sockets(self) -> None:
@@ -145,9 +140,8 @@ class ZMQIPCCommunication(BaseZMQCommunication):
             ipc_files = glob.glob(str(self._ipc_socket_dir / "*.ipc"))
             for ipc_file in ipc_files:
                 try:
-                    if os.path.exists(ipc_file):
-                        os.unlink(ipc_file)
-                        self.debug(f"Removed IPC socket file: {ipc_file}")
+                    os.unlink(ipc_file)
+                    self.debug(f"Removed IPC socket file: {ipc_file}")
                 except OSError as e:
                     if e.errno != errno.ENOENT:
                         self.warning(
@@ -7,6 +7,8 @@ import logging
 import random
 import time
 from contextlib import asynccontextmanager
+from functools import cache
+from typing import Any
 
 from aiperf_mock_server.config import server_config
 from aiperf_mock_server.dcgm_faker import DCGMFaker
@@ -26,13 +28,14 @@ from aiperf_mock_server.models import (
     TextCompletionResponse,
 )
 from aiperf_mock_server.utils import (
+    OrjsonResponse,
     RequestContext,
     stream_chat_completion,
     stream_text_completion,
     with_error_injection,
 )
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
 dcgm_fakers: list[DCGMFaker] = []
 logger = logging.getLogger(__name__)
@@ -71,7 +74,12 @@ async def lifespan(_: FastAPI):
     yield
 
 
-app = FastAPI(title="AIPerf Mock Server", version="2.0.0", lifespan=lifespan)
+app = FastAPI(
+    title="AIPerf Mock Server",
+    version="2.0.0",
+    lifespan=lifespan,
+    default_response_class=OrjsonResponse,
+)
 
 # ============================================================================
 # Chat Completions
@@ -369,7 +377,7 @@ async def huggingface_generate(req: dict):
     max_new_tokens = req.get("parameters", {}).get("max_new_tokens", 50)
 
     fake_text = f"{prompt} [mocked generation, {max_new_tokens} tokens]"
-    return JSONResponse(content={"generated_text": fake_text})
+    return OrjsonResponse(content={"generated_text": fake_text})
 
 
 @app.post("/generate_stream", response_model=None)
@@ -394,10 +402,16 @@ async def huggingface_generate_stream(req: dict):
 # ============================================================================
 
 
+@cache
+def _server_config_dict() -> dict[str, Any]:
+    """Dump the server config once; it is fixed for the lifetime of the process."""
+    return server_config.model_dump()
+
+
 @app.get("/health")
 async def health():
     """Health check."""
-    return {"status": "healthy", "config": server_config.model_dump()}
+    return {"status": "healthy", "config": _server_config_dict()}
 
 
 @app.get("/")
@@ -406,7 +420,7 @@ async def root():
     return {
         "message": "AIPerf Mock Server",
         "version": "2.0.0",
-        "config": server_config.model_dump(),
+        "config": _server_config_dict(),
     }
 
 
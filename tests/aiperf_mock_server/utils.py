@@ -12,6 +12,7 @@ from functools import wraps
 from time import perf_counter
 from typing import Any, Generic
 
+import orjson
 from aiperf_mock_server.config import server_config
 from aiperf_mock_server.models import (
     ChatCompletionRequest,
@@ -27,15 +28,23 @@ from aiperf_mock_server.models import (
 )
 from aiperf_mock_server.tokens import Tokenizer
 from fastapi import HTTPException
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
 # ============================================================================
-# FastAPI Decorators
+# FastAPI Responses & Decorators
 # ============================================================================
 
 
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib json module."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 def with_error_injection(func: Callable[..., Any]) -> Callable[..., Any]:
     """Decorator to inject errors based on config."""
 
@@ -88,6 +97,7 @@ class RequestContext(Generic[RequestTypeVarT]):
         self.request = request
         self.latency_sim = LatencySimulator()
         self.request_id = create_request_id(request)
+        self.created = int(time.time())
         self.tokenized = Tokenizer.tokenize_request(request)
 
     async def wait_until_completion(self) -> None:
@@ -119,6 +129,10 @@ def create_request_id(request: RequestTypeVarT) -> str:
 # Streaming & Response Generation
 # ============================================================================
 
+# NOTE: Per-token chunk models are built with `model_construct` since every field
+# comes from already-validated request/tokenizer data; full validation per chunk
+# is pure overhead on the streaming hot path.
+
 
 async def stream_chat_completion(
     ctx: RequestContext[ChatCompletionRequest],
@@ -134,7 +148,7 @@ async def stream_chat_completion(
     if ctx.request.include_usage:
         response = ChatStreamCompletionResponse(
             id=ctx.request_id,
-            created=int(time.time()),
+            created=ctx.created,
             model=ctx.request.model,
             choices=[],
             usage=ctx.tokenized.create_usage(),
@@ -149,13 +163,13 @@ async def _stream_chat_reasoning_tokens(
 ) -> AsyncGenerator[str, None]:
     """Stream reasoning content tokens for chat completions."""
     for token in ctx.tokenized.reasoning_content_tokens:
-        delta = ChatDelta(reasoning_content=token)
-        delta.role = "assistant"
-
-        choice = ChatStreamChoice(index=0, finish_reason=None, delta=delta)
-        response = ChatStreamCompletionResponse(
+        delta = ChatDelta.model_construct(reasoning_content=token, role="assistant")
+        choice = ChatStreamChoice.model_construct(
+            index=0, finish_reason=None, delta=delta
+        )
+        response = ChatStreamCompletionResponse.model_construct(
             id=ctx.request_id,
-            created=int(time.time()),
+            created=ctx.created,
             model=ctx.request.model,
             choices=[choice],
         )
@@ -171,20 +185,20 @@ async def _stream_chat_output_tokens(
     has_reasoning = bool(ctx.tokenized.reasoning_content_tokens)
 
     for i, token in enumerate(ctx.tokenized.tokens):
-        delta = ChatDelta(content=token)
-        if i == 0 and not has_reasoning:
-            delta.role = "assistant"
-
-        choice = ChatStreamChoice(
+        delta = ChatDelta.model_construct(
+            content=token,
+            role="assistant" if i == 0 and not has_reasoning else None,
+        )
+        choice = ChatStreamChoice.model_construct(
             index=0,
             finish_reason=ctx.tokenized.finish_reason
             if i == len(ctx.tokenized.tokens) - 1
             else None,
             delta=delta,
         )
-        response = ChatStreamCompletionResponse(
+        response = ChatStreamCompletionResponse.model_construct(
             id=ctx.request_id,
-            created=int(time.time()),
+            created=ctx.created,
             model=ctx.request.model,
             choices=[choice],
         )
@@ -198,12 +212,12 @@ async def _stream_text_output_tokens(
 ) -> AsyncGenerator[str, None]:
     """Stream output content tokens for text completions."""
     for i, token in enumerate(ctx.tokenized.tokens):
-        response = TextStreamCompletionResponse(
+        response = TextStreamCompletionResponse.model_construct(
             id=ctx.request_id,
-            created=int(time.time()),
+            created=ctx.created,
             model=ctx.request.model,
             choices=[
-                TextStreamChoice(
+                TextStreamChoice.model_construct(
                     index=0,
                     finish_reason=ctx.tokenized.finish_reason
                     if i == len(ctx.tokenized.tokens) - 1
@@ -227,7 +241,7 @@ async def stream_text_completion(
     if ctx.request.include_usage:
         response = TextStreamCompletionResponse(
             id=ctx.request_id,
-            created=int(time.time()),
+            created=ctx.created,
             model=ctx.request.model,
             choices=[],
             usage=ctx.tokenized.create_usage(),
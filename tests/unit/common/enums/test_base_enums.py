@@ -0,0 +1,29 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES.
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from aiperf.common.enums import MetricType
+
+
+class TestCaseInsensitiveStrEnum:
+    """Tests for the equality semantics of CaseInsensitiveStrEnum."""
+
+    @pytest.mark.parametrize(
+        "other,expected",
+        [
+            (MetricType.RECORD, True),
+            (MetricType.AGGREGATE, False),
+            ("record", True),
+            ("RECORD", True),
+            ("aggregate", False),
+            (1, False),
+        ],
+    )
+    def test_eq(self, other: object, expected: bool):
+        member = MetricType.RECORD
+        assert (member == other) is expected
+
+    def test_hash_matches_case_insensitive_eq(self):
+        assert {MetricType.RECORD: 1}[MetricType("RECORD")] == 1
+        assert hash(MetricType.RECORD) == hash("record")
@@ -44,7 +44,6 @@ class TestRealtimeTelemetryMetricsMixin:
         """Test that mixin initializes with correct attributes."""
         assert hasattr(mocked_mixin, "_controller")
         assert hasattr(mocked_mixin, "_telemetry_metrics")
-        assert hasattr(mocked_mixin, "_telemetry_metrics_lock")
         assert mocked_mixin._telemetry_metrics == []
 
     @pytest.mark.asyncio
@@ -124,37 +123,26 @@ class TestRealtimeTelemetryMetricsMixin:
         mocked_mixin.run_hooks.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_concurrent_access_with_lock(self, mocked_mixin):
-        """Test that the lock protects concurrent access to telemetry metrics."""
-
-        # Track lock acquisition order
-        lock_acquired_order = []
-
-        async def acquire_lock_and_update(metrics_value, delay):
-            """Helper to simulate concurrent updates."""
-            async with mocked_mixin._telemetry_metrics_lock:
-                lock_acquired_order.append(metrics_value)
-                await asyncio.sleep(delay)
-                mocked_mixin._telemetry_metrics = [
+    async def test_concurrent_updates_keep_latest_metrics(self, mocked_mixin):
+        """Test that concurrent telemetry messages leave the metrics from the last one received."""
+        messages = [
+            RealtimeTelemetryMetricsMessage(
+                service_id="records_manager",
+                metrics=[
                     MetricResult(
-                        tag=f"metric_{metrics_value}",
-                        header=f"Metric {metrics_value}",
-                        unit="ms",
-                        avg=float(metrics_value),
+                        tag=f"metric_{i}", header=f"Metric {i}", unit="ms", avg=float(i)
                     )
-                ]
+                ],
+            )
+            for i in range(2)
+        ]
 
-        # Start two concurrent operations
         await asyncio.gather(
-            acquire_lock_and_update(1, 0.01), acquire_lock_and_update(2, 0.005)
+            *[mocked_mixin._on_realtime_telemetry_metrics(m) for m in messages]
         )
 
-        # Both should have acquired the lock (order doesn't matter for this test)
-        assert len(lock_acquired_order) == 2
-        assert set(lock_acquired_order) == {1, 2}
-
-        # Final value should be from the last completed operation
-        assert len(mocked_mixin._telemetry_metrics) == 1
+        assert mocked_mixin._telemetry_metrics == messages[-1].metrics
+        assert mocked_mixin.run_hooks.call_count == 2
 
     @pytest.mark.asyncio
     async def test_multiple_metrics_handling(self, mocked_mixin):
@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: Copyright (c) 2025 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from aiperf.common.config import ServiceConfig
+from aiperf.common.hooks import AIPerfHook
+from aiperf.common.messages import WorkerHealthMessage
+from aiperf.common.mixins.worker_tracker_mixin import WorkerTrackerMixin
+from aiperf.common.models import ProcessHealth, WorkerTaskStats
+
+
+class TestWorkerTrackerMixin:
+    """Test suite for WorkerTrackerMixin functionality."""
+
+    @pytest.fixture
+    def mocked_mixin(self):
+        """Create a WorkerTrackerMixin instance with mocked dependencies."""
+        with patch(
+            "aiperf.common.mixins.message_bus_mixin.MessageBusClientMixin.__init__",
+            return_value=None,
+        ):
+            mixin = WorkerTrackerMixin(service_config=ServiceConfig())
+            mixin.run_hooks = AsyncMock()
+            mixin.warning = MagicMock()
+        return mixin
+
+    @staticmethod
+    def _health_message(worker_id: str, total: int) -> WorkerHealthMessage:
+        return WorkerHealthMessage(
+            service_id=worker_id,
+            health=ProcessHealth(
+                create_time=0.0, uptime=1.0, cpu_usage=0.0, memory_usage=0
+            ),
+            task_stats=WorkerTaskStats(total=total),
+        )
+
+    @pytest.mark.asyncio
+    async def test_on_worker_health_updates_stats(self, mocked_mixin):
+        """Test that worker health messages create and update the worker stats."""
+        await mocked_mixin._on_worker_health(self._health_message("worker_1", 1))
+        await mocked_mixin._on_worker_health(self._health_message("worker_1", 5))
+
+        assert list(mocked_mixin._workers_stats) == ["worker_1"]
+        assert mocked_mixin._workers_stats["worker_1"].task_stats.total == 5
+
+    @pytest.mark.asyncio
+    async def test_on_worker_health_runs_hooks_outside_lock(self, mocked_mixin):
+        """Test that the worker update hooks do not hold the worker stats lock."""
+        lock_held_during_hook = []
+
+        async def run_hooks(*args, **kwargs):
+            lock_held_during_hook.append(mocked_mixin._workers_stats_lock.locked())
+
+        mocked_mixin.run_hooks = AsyncMock(side_effect=run_hooks)
+
+        await mocked_mixin._on_worker_health(self._health_message("worker_1", 1))
+
+        assert lock_held_during_hook == [False]
+        mocked_mixin.run_hooks.assert_called_once_with(
+            AIPerfHook.ON_WORKER_UPDATE,
+            worker_id="worker_1",
+            worker_stats=mocked_mixin._workers_stats["worker_1"],
+        )
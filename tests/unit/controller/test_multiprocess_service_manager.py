@@ -2,13 +2,17 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import asyncio
-from multiprocessing import Process
+import signal
+import time
+from multiprocessing import Event, Process
+from multiprocessing.synchronize import Event as EventType
 from unittest.mock import MagicMock
 
 import pytest
 
-from aiperf.common.enums import ServiceType
+from aiperf.common.enums import ServiceRegistrationStatus, ServiceType
 from aiperf.common.exceptions import AIPerfError
+from aiperf.common.models import ServiceRunInfo
 from aiperf.controller.multiprocess_service_manager import (
     MultiProcessRunInfo,
     MultiProcessServiceManager,
@@ -16,6 +20,16 @@ from aiperf.controller.multiprocess_service_manager import (
 from tests.unit.conftest import real_sleep
 
 
+def _sleep_forever() -> None:
+    time.sleep(60)
+
+
+def _ignore_sigterm_and_sleep(handler_installed: EventType) -> None:
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    handler_installed.set()
+    time.sleep(60)
+
+
 class TestMultiProcessServiceManager:
     """Test MultiProcessServiceManager process failure scenarios."""
 
@@ -164,3 +178,82 @@ class TestMultiProcessServiceManager:
         await service_manager.wait_for_all_services_registration(
             stop_event=stop_event, timeout_seconds=10
         )
+
+    @pytest.mark.asyncio
+    async def test_registration_wakes_up_wait_immediately(
+        self, service_manager: MultiProcessServiceManager, mock_alive_process: MagicMock
+    ):
+        """Test that registering the last required service ends the wait without polling."""
+        service_manager.multi_process_info = [
+            MultiProcessRunInfo.model_construct(
+                process=mock_alive_process,
+                service_type=service_type,
+                service_id=f"{service_type}_1",
+            )
+            for service_type in service_manager.required_services
+        ]
+
+        wait_task = asyncio.create_task(
+            service_manager.wait_for_all_services_registration(
+                stop_event=asyncio.Event(), timeout_seconds=10
+            )
+        )
+        await real_sleep(0.01)
+        assert not wait_task.done()
+
+        for service_type in service_manager.required_services:
+            service_manager.register_service(
+                ServiceRunInfo(
+                    registration_status=ServiceRegistrationStatus.REGISTERED,
+                    service_type=service_type,
+                    service_id=f"{service_type}_1",
+                )
+            )
+
+        # Well under the 0.5s liveness re-check interval
+        await asyncio.wait_for(wait_task, timeout=0.25)
+        assert set(service_manager.service_map) == set(
+            service_manager.required_services
+        )
+
+    @pytest.mark.asyncio
+    async def test_wait_for_process_exit_detects_terminated_process(self):
+        """Test that process exit is observed through the process sentinel."""
+        process = Process(target=_sleep_forever, daemon=True)
+        process.start()
+
+        assert not await MultiProcessServiceManager._wait_for_process_exit(
+            process, timeout=0.05
+        )
+
+        process.terminate()
+        assert await MultiProcessServiceManager._wait_for_process_exit(
+            process, timeout=5.0
+        )
+        assert process.exitcode == -signal.SIGTERM
+
+    @pytest.mark.asyncio
+    async def test_wait_for_process_kills_unresponsive_process(
+        self, service_manager: MultiProcessServiceManager, monkeypatch
+    ):
+        """Test that a process ignoring SIGTERM is killed after the timeout."""
+        monkeypatch.setattr(
+            "aiperf.controller.multiprocess_service_manager.Environment.SERVICE.TASK_CANCEL_TIMEOUT_SHORT",
+            0.2,
+        )
+        handler_installed = Event()
+        process = Process(
+            target=_ignore_sigterm_and_sleep, args=(handler_installed,), daemon=True
+        )
+        process.start()
+        assert await asyncio.to_thread(handler_installed.wait, 10)
+
+        await service_manager._wait_for_process(
+            MultiProcessRunInfo.model_construct(
+                process=process,
+                service_type=ServiceType.DATASET_MANAGER,
+                service_id="stubborn_service",
+            )
+        )
+
+        assert process.exitcode == -signal.SIGKILL
@@ -178,8 +178,8 @@ class TestMetricRecordProcessor:
             assert isinstance(result, MetricRecordDict)
             assert FailingMetricNoValue.tag not in result
             mock_debug.assert_called_once()
-            assert f"No metric value for metric '{FailingMetricNoValue.tag}'" in str(
-                mock_debug.call_args
+            assert f"No metric value for metric '{FailingMetricNoValue.tag}'" in (
+                mock_debug.call_args.args[0]()
             )
 
     @pytest.mark.asyncio
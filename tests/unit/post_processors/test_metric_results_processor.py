@@ -225,12 +225,15 @@ class TestMetricResultsProcessor:
             avg=20.0,
             count=3,
         )
-        metric_array.to_result = Mock(return_value=expected_result)
-
-        result = processor._create_metric_result(RequestLatencyMetric.tag, metric_array)
+        with patch.object(
+            MetricArray, "to_result", return_value=expected_result
+        ) as mock_to_result:
+            result = processor._create_metric_result(
+                RequestLatencyMetric.tag, metric_array
+            )
 
         assert result == expected_result
-        metric_array.to_result.assert_called_once_with(
+        mock_to_result.assert_called_once_with(
             RequestLatencyMetric.tag,
             RequestLatencyMetric.header,
             str(RequestLatencyMetric.unit),
@@ -248,8 +251,7 @@ class TestMetricResultsProcessor:
                 RequestLatencyMetric.tag, {"invalid": "dict"}
             )
 
-    @pytest.mark.asyncio
-    async def test_get_instances_map_default_behavior(
+    def test_get_instances_map_default_behavior(
         self, mock_metric_registry: Mock, mock_user_config: UserConfig
     ) -> None:
         """Test default get_instances_map returns shared instances map regardless of request_start_ns."""
@@ -259,18 +261,17 @@ class TestMetricResultsProcessor:
         processor._instances_map = {RequestCountMetric.tag: RequestCountMetric()}
 
         # Call with None (should be ignored in base implementation)
-        instances_map_none = await processor.get_instances_map(None)
+        instances_map_none = processor.get_instances_map(None)
         assert instances_map_none is processor._instances_map
 
         # Call with a timestamp (should also be ignored in base implementation)
-        instances_map_with_time = await processor.get_instances_map(1000000000)
+        instances_map_with_time = processor.get_instances_map(1000000000)
         assert instances_map_with_time is processor._instances_map
 
         # Both should return the same shared instances map
         assert instances_map_none is instances_map_with_time
 
-    @pytest.mark.asyncio
-    async def test_get_results_default_behavior(
+    def test_get_results_default_behavior(
         self, mock_metric_registry: Mock, mock_user_config: UserConfig
     ) -> None:
         """Test default get_results returns shared results dict regardless of request_start_ns."""
@@ -280,12 +281,12 @@ class TestMetricResultsProcessor:
         processor._results["test_metric"] = 42
 
         # Call with None (should be ignored in base implementation)
-        results_dict_none = await processor.get_results(None)
+        results_dict_none = processor.get_results(None)
         assert results_dict_none is processor._results
         assert results_dict_none["test_metric"] == 42
 
         # Call with a timestamp (should also be ignored in base implementation)
-        results_dict_with_time = await processor.get_results(1000000000)
+        results_dict_with_time = processor.get_results(1000000000)
         assert results_dict_with_time is processor._results
         assert results_dict_with_time["test_metric"] == 42
 
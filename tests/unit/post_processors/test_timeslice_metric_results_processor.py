@@ -45,8 +45,7 @@ class TestTimesliceMetricResultsProcessor:
         assert hasattr(processor, "_slice_duration_ns")
         assert processor._slice_duration_ns == 1.0 * NANOS_PER_SECOND
 
-    @pytest.mark.asyncio
-    async def test_get_instances_map_requires_request_start_ns(
+    def test_get_instances_map_requires_request_start_ns(
         self, mock_metric_registry: Mock, mock_user_config: UserConfig
     ) -> None:
         """Test that get_instances_map raises ValueError when request_start_ns is None."""
@@ -54,10 +53,9 @@ class TestTimesliceMetricResultsProcessor:
         processor = TimesliceMetricResultsProcessor(mock_user_config)
 
         with pytest.raises(ValueError, match="must be passed a request_start_ns"):
-            await processor.get_instances_map(None)
+            processor.get_instances_map(None)
 
-    @pytest.mark.asyncio
-    async def test_get_results_requires_request_start_ns(
+    def test_get_results_requires_request_start_ns(
         self, mock_metric_registry: Mock, mock_user_config: UserConfig
     ) -> None:
         """Test that get_results raises ValueError when request_start_ns is None."""
@@ -65,7 +63,7 @@ class TestTimesliceMetricResultsProcessor:
         processor = TimesliceMetricResultsProcessor(mock_user_config)
 
         with pytest.raises(ValueError, match="must be passed a request_start_ns"):
-            await processor.get_results(None)
+            processor.get_results(None)
 
     @pytest.mark.asyncio
     async def test_process_result_separates_by_timeslice(
@@ -348,8 +346,7 @@ class TestTimesliceMetricResultsProcessor:
                 float(i)
             ]
 
-    @pytest.mark.asyncio
-    async def test_timeslice_instances_map_creates_separate_instances(
+    def test_timeslice_instances_map_creates_separate_instances(
         self, mock_metric_registry: Mock, mock_user_config: UserConfig
     ) -> None:
         """Test that each timeslice gets its own metric instances."""
@@ -361,8 +358,8 @@ class TestTimesliceMetricResultsProcessor:
         request_start_ns_1 = int(0.5 * NANOS_PER_SECOND)
         request_start_ns_2 = int(1.5 * NANOS_PER_SECOND)
 
-        instances_map_0 = await processor.get_instances_map(request_start_ns_1)
-        instances_map_1 = await processor.get_instances_map(request_start_ns_2)
+        instances_map_0 = processor.get_instances_map(request_start_ns_1)
+        instances_map_1 = processor.get_instances_map(request_start_ns_2)
 
         # Verify they are different instances
         assert instances_map_0 is not instances_map_1
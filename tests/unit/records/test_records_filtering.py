@@ -444,6 +444,84 @@ class TestRecordsManagerTelemetry:
         # Processor should be called for each record
         assert mock_processor.process_telemetry_record.call_count == len(records)
 
+    @pytest.mark.asyncio
+    async def test_send_telemetry_batch_to_each_processor_in_order(self):
+        """Test that each processor receives the whole batch, in order."""
+        from unittest.mock import AsyncMock, Mock
+
+        from aiperf.common.models import TelemetryMetrics, TelemetryRecord
+        from aiperf.records.records_manager import RecordsManager
+
+        processors = [Mock(), Mock()]
+        for processor in processors:
+            processor.process_telemetry_record = AsyncMock()
+        instance = MagicMock()
+        instance._telemetry_results_processors = processors
+
+        records = [
+            TelemetryRecord(
+                timestamp_ns=1000000 + i,
+                dcgm_url="http://localhost:9400/metrics",
+                gpu_index=i,
+                gpu_uuid=f"GPU-{i}",
+                gpu_model_name="Test GPU",
+                telemetry_data=TelemetryMetrics(),
+            )
+            for i in range(3)
+        ]
+
+        await RecordsManager._send_telemetry_to_results_processors(instance, records)
+
+        for processor in processors:
+            received = [
+                call.args[0]
+                for call in processor.process_telemetry_record.await_args_list
+            ]
+            assert received == records
+
+    @pytest.mark.asyncio
+    async def test_send_telemetry_batch_continues_after_record_error(self):
+        """Test that a failing record is counted and the rest of the batch is still processed."""
+        from unittest.mock import AsyncMock, Mock
+
+        from aiperf.common.models import TelemetryMetrics, TelemetryRecord
+        from aiperf.records.records_manager import (
+            RecordsManager,
+            TelemetryTrackingState,
+        )
+
+        records = [
+            TelemetryRecord(
+                timestamp_ns=1000000 + i,
+                dcgm_url="http://localhost:9400/metrics",
+                gpu_index=i,
+                gpu_uuid=f"GPU-{i}",
+                gpu_model_name="Test GPU",
+                telemetry_data=TelemetryMetrics(),
+            )
+            for i in range(3)
+        ]
+
+        async def fail_on_middle_record(record: TelemetryRecord) -> None:
+            if record is records[1]:
+                raise ValueError("bad record")
+
+        processor = Mock()
+        processor.process_telemetry_record = AsyncMock(
+            side_effect=fail_on_middle_record
+        )
+        instance = MagicMock()
+        instance._telemetry_results_processors = [processor]
+        instance._telemetry_state = TelemetryTrackingState()
+
+        await RecordsManager._send_telemetry_to_results_processors(instance, records)
+
+        received = [
+            call.args[0] for call in processor.process_telemetry_record.await_args_list
+        ]
+        assert received == records
+        assert list(instance._telemetry_state.error_counts.values()) == [1]
+
     def test_telemetry_hierarchy_add_record(self):
         """Test that telemetry hierarchy adds records correctly."""
         from aiperf.common.models import (
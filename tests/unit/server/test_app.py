@@ -20,6 +20,12 @@ class TestAPIEndpoints:
         assert data["status"] == "healthy"
         assert "config" in data
 
+    def test_health_and_root_report_same_config(self, test_client):
+        health = test_client.get("/health").json()
+        root = test_client.get("/").json()
+        assert health["config"] == root["config"]
+        assert health["config"]["port"] == 8000
+
     def test_chat_completions_endpoint(self, test_client):
         response = test_client.post(
             "/v1/chat/completions",
@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 """Unit tests for utils module."""
 
+import orjson
 import pytest
 from aiperf_mock_server.models import (
     ChatCompletionRequest,
@@ -10,6 +11,7 @@ from aiperf_mock_server.models import (
 )
 from aiperf_mock_server.utils import (
     LatencySimulator,
+    OrjsonResponse,
     RequestContext,
     create_request_id,
     stream_chat_completion,
@@ -40,6 +42,16 @@ class TestGetRequestId:
         assert len(req_id) > 10
 
 
+class TestOrjsonResponse:
+    """Tests for OrjsonResponse class."""
+
+    def test_render_compact_json(self):
+        response = OrjsonResponse(content={"status": "healthy", "ids": [1, 2]})
+
+        assert response.body == b'{"status":"healthy","ids":[1,2]}'
+        assert response.media_type == "application/json"
+
+
 class TestWithErrorInjection:
     """Tests for with_error_injection decorator."""
 
@@ -159,3 +171,23 @@ class TestStreamChatCompletion:
             chunks.append(chunk)
 
         assert any("usage" in chunk for chunk in chunks)
+
+    @pytest.mark.asyncio
+    async def test_stream_chat_completion_chunks_share_created(self):
+        req = ChatCompletionRequest(
+            model="test",
+            messages=[Message(role="user", content="Hello there world")],
+            stream_options={"include_usage": True},
+        )
+        ctx = RequestContext(req)
+
+        chunks = [
+            orjson.loads(chunk.removeprefix("data: "))
+            async for chunk in stream_chat_completion(ctx)
+            if chunk != "data: [DONE]\n\n"
+        ]
+
+        assert len(chunks) > 1
+        assert {chunk["created"] for chunk in chunks} == {ctx.created}
+        assert chunks[0]["choices"][0]["delta"]["role"] == "assistant"
+        assert "role" not in chunks[1]["choices"][0]["delta"]
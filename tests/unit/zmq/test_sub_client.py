@@ -5,7 +5,7 @@ Tests for sub_client.py - ZMQSubClient class.
 """
 
 import asyncio
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, Mock, call
 
 import pytest
 import zmq
@@ -187,6 +187,28 @@ class TestZMQSubClientMessageHandling:
         assert len(received_messages) == 1
         assert received_messages[0].message_type == sample_message.message_type
 
+    @pytest.mark.asyncio
+    async def test_handle_message_memoizes_topic_name(
+        self, mock_zmq_context, sample_message, create_callback_tracker
+    ):
+        """Test that the decoded topic name is cached per topic frame."""
+        client = ZMQSubClient(address="tcp://127.0.0.1:5555", bind=False)
+
+        callback, event, received_messages = create_callback_tracker()
+        client._subscribers[sample_message.message_type] = [callback]
+
+        topic_bytes = f"{sample_message.message_type}{TOPIC_END}".encode()
+        message_bytes = sample_message.model_dump_json().encode()
+
+        await client._handle_message(topic_bytes, message_bytes)
+        await asyncio.wait_for(event.wait(), timeout=1.0)
+        cached_topic = client._topic_names[topic_bytes]
+        assert cached_topic == sample_message.message_type
+
+        await client._handle_message(topic_bytes, message_bytes)
+        assert client._topic_names == {topic_bytes: sample_message.message_type}
+        assert client._topic_names[topic_bytes] is cached_topic
+
     @pytest.mark.asyncio
     async def test_handle_message_with_targeted_topic(self, mock_zmq_context):
         """Test handling messages with targeted topics (service_id/type)."""
@@ -322,6 +344,96 @@ class TestZMQSubClientBackgroundTask:
 
         await client.stop()
 
+    @pytest.mark.asyncio
+    async def test_background_task_drains_queued_messages_without_blocking(
+        self, mock_zmq_context, sample_message, wait_for_background_task
+    ):
+        """Test that queued messages are drained with non-blocking receives."""
+        topic_bytes = f"{sample_message.message_type}{TOPIC_END}".encode()
+        message_bytes = sample_message.model_dump_json().encode()
+
+        mock_socket = AsyncMock(spec=zmq.asyncio.Socket)
+        mock_socket.bind = Mock()
+        mock_socket.setsockopt = Mock()
+        mock_socket.recv_multipart = AsyncMock(
+            side_effect=[[topic_bytes, message_bytes] for _ in range(3)] + [zmq.Again()]
+        )
+        mock_zmq_context.socket = Mock(return_value=mock_socket)
+
+        client = ZMQSubClient(address="tcp://127.0.0.1:5555", bind=False)
+
+        received = []
+        all_received = asyncio.Event()
+
+        async def callback(msg: Message) -> None:
+            received.append(msg)
+            if len(received) == 3:
+                all_received.set()
+
+        await client.initialize()
+        await client.subscribe(sample_message.message_type, callback)
+        await client.start()
+        await wait_for_background_task()
+
+        await asyncio.wait_for(all_received.wait(), timeout=1.0)
+        await client.stop()
+
+        calls = mock_socket.recv_multipart.call_args_list
+        assert calls[0] == call()
+        assert calls[1] == call(zmq.NOBLOCK)
+        assert calls[2] == call(zmq.NOBLOCK)
+        assert calls[3] == call(zmq.NOBLOCK)
+
+    @pytest.mark.asyncio
+    async def test_background_task_yields_between_drain_batches(
+        self, mock_zmq_context, sample_message, wait_for_background_task
+    ):
+        """Test that other tasks get to run between full drain batches."""
+        topic_bytes = f"{sample_message.message_type}{TOPIC_END}".encode()
+        message_bytes = sample_message.model_dump_json().encode()
+
+        ticks = 0
+        ticks_at_recv: list[int] = []
+        queued = 7
+        drained = asyncio.Event()
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        async def recv_multipart(*args, **kwargs):
+            # Queued messages are returned without suspending, like a real socket
+            ticks_at_recv.append(ticks)
+            if len(ticks_at_recv) <= queued:
+                return [topic_bytes, message_bytes]
+            drained.set()
+            await asyncio.Event().wait()
+
+        mock_socket = AsyncMock(spec=zmq.asyncio.Socket)
+        mock_socket.bind = Mock()
+        mock_socket.setsockopt = Mock()
+        mock_socket.recv_multipart = AsyncMock(side_effect=recv_multipart)
+        mock_zmq_context.socket = Mock(return_value=mock_socket)
+
+        client = ZMQSubClient(address="tcp://127.0.0.1:5555", bind=False)
+        client._drain_batch_size = 2
+
+        await client.initialize()
+        ticker_task = asyncio.create_task(ticker())
+        await client.start()
+        await wait_for_background_task()
+        await asyncio.wait_for(drained.wait(), timeout=1.0)
+        await client.stop()
+        ticker_task.cancel()
+
+        # Each outer iteration is one blocking receive plus a full batch of 2 drains,
+        # so receives 0-2, 3-5 and 6-7 are the three batches.
+        assert ticks_at_recv[0] == ticks_at_recv[1] == ticks_at_recv[2]
+        assert ticks_at_recv[3] > ticks_at_recv[2]
+        assert ticks_at_recv[6] > ticks_at_recv[5]
+
     @pytest.mark.asyncio
     async def test_background_task_handles_zmq_again(
         self, mock_zmq_context, wait_for_background_task